@@ -18,97 +18,303 @@ their actual release values instead of uniform sampling.
 """
 
 import argparse
+import hashlib
+import os
 import numpy as np
-from PIL import Image
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
 
-def bilinear_sample(img, x, y):
-    """Sample image at floating point coordinates with bilinear interpolation."""
-    h, w = img.shape[:2]
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
-    x = np.clip(x, 0, w - 1)
-    y = np.clip(y, 0, h - 1)
+# Numba and CuPy are imported on first use only (see _get_numba_kernel and _get_cupy),
+# since both take far longer to import than a typical run. prange is rebound to
+# numba.prange before _bilinear_remap is compiled
+prange = range
 
-    x0 = np.floor(x).astype(int)
-    y0 = np.floor(y).astype(int)
-    x1 = np.minimum(x0 + 1, w - 1)
-    y1 = np.minimum(y0 + 1, h - 1)
+# Tile edge for the NumPy sampler, sized so one tile's temporaries stay cache resident
+SAMPLE_TILE = 64
 
-    fx = x - x0
-    fy = y - y0
 
-    # Expand dims for broadcasting with color channels
-    if img.ndim == 3:
-        fx = fx[..., np.newaxis]
-        fy = fy[..., np.newaxis]
+def _bilinear_sample_padded(img, x, y):
+    """
+    Sample image at floating point coordinates with bilinear interpolation.
+
+    img is either a single (H x W) plane or a channel-first (C x H x W) stack of planes;
+    the weights are computed once and each contiguous plane is sampled in turn.
+    The planes must carry one extra edge-replicated row and column on the bottom and
+    right, so the +1 neighbours are always in bounds without clamping.
+    """
+    h, w = img.shape[-2] - 1, img.shape[-1] - 1
+
+    x = np.clip(np.asarray(x, dtype=np.float32), 0, w - 1)
+    y = np.clip(np.asarray(y, dtype=np.float32), 0, h - 1)
+
+    # Keep the fractional weights in float32 (float32 - intp would promote to float64)
+    fx = x - np.floor(x)
+
+    # Flat indices of the corners in a padded plane, paired with their weights
+    padded_w = img.shape[-1]
+    idx00 = y.astype(np.intp) * padded_w + x.astype(np.intp)
+    idx10 = idx00 + 1
+    if h == 1:
+        # A single row is a 1-D lerp; the lower corners would always have zero weight
+        corners = ((idx00, 1 - fx), (idx10, fx))
+    else:
+        fy = y - np.floor(y)
+        idx01 = idx00 + padded_w
+        idx11 = idx01 + 1
+        corners = ((idx00, (1 - fx) * (1 - fy)),
+                   (idx10, fx * (1 - fy)),
+                   (idx01, (1 - fx) * fy),
+                   (idx11, fx * fy))
+
+    planes = img.reshape((-1,) + img.shape[-2:])
+    out = np.empty((planes.shape[0],) + x.shape, dtype=np.float32)
+    tmp = np.empty(x.shape, dtype=np.float32)
+    for plane, dst in zip(planes, out):
+        # Gather each corner from the flat plane and accumulate it in place. mode='clip'
+        # clamps every index (a no-op here, the padding keeps them in bounds) and, unlike
+        # the default mode='raise', lets np.take write into out= without an extra buffer
+        flat = plane.ravel()
+        (idx, weight), rest = corners[0], corners[1:]
+        np.take(flat, idx, out=dst, mode='clip')
+        dst *= weight
+        for idx, weight in rest:
+            np.take(flat, idx, out=tmp, mode='clip')
+            tmp *= weight
+            dst += tmp
+    return out.reshape(img.shape[:-2] + x.shape)
+
+
+def _bilinear_remap(img, src_x, src_y, out):
+    """
+    Fused bilinear remap of an (H x W x C) image into uint8 out, one thread per output row.
+
+    Unlike _bilinear_sample_padded, img is not padded; the scalar clamps are nearly free
+    here, whereas padding would copy the whole gradient on every call.
+    """
+    h, w, channels = img.shape
+
+    for i in prange(src_x.shape[0]):
+        for j in range(src_x.shape[1]):
+            x = min(max(src_x[i, j], 0.0), w - 1.0)
+            y = min(max(src_y[i, j], 0.0), h - 1.0)
+
+            x0 = int(x)
+            y0 = int(y)
+            x1 = min(x0 + 1, w - 1)
+            y1 = min(y0 + 1, h - 1)
+
+            fx = x - x0
+            fy = y - y0
+
+            w00 = (1.0 - fx) * (1.0 - fy)
+            w10 = fx * (1.0 - fy)
+            w01 = (1.0 - fx) * fy
+            w11 = fx * fy
+
+            for c in range(channels):
+                value = (img[y0, x0, c] * w00 +
+                         img[y0, x1, c] * w10 +
+                         img[y1, x0, c] * w01 +
+                         img[y1, x1, c] * w11)
+                # Round to nearest like cv2.remap and the NumPy path
+                out[i, j, c] = np.rint(min(max(value, 0.0), 255.0))
+
+
+_numba_kernel = None
+
+
+def _get_numba_kernel():
+    """Compile _bilinear_remap with Numba on first use; None when Numba is not installed."""
+    global _numba_kernel, prange
+    if _numba_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _numba_kernel = False
+        else:
+            prange = numba.prange
+            _numba_kernel = numba.njit(parallel=True, fastmath=True, cache=True)(_bilinear_remap)
+    return _numba_kernel or None
 
-    w00 = (1 - fx) * (1 - fy)
-    w10 = fx * (1 - fy)
-    w01 = (1 - fx) * fy
-    w11 = fx * fy
 
-    return (img[y0, x0] * w00 +
-            img[y0, x1] * w10 +
-            img[y1, x0] * w01 +
-            img[y1, x1] * w11)
+_cupy = None
 
 
-def build_red_to_green_map(erosion):
+def _get_cupy():
+    """Import CuPy and its ndimage module on first use; None when CuPy is not installed."""
+    global _cupy
+    if _cupy is None:
+        try:
+            import cupy
+            from cupyx.scipy import ndimage
+        except ImportError:
+            _cupy = False
+        else:
+            _cupy = (cupy, ndimage)
+    return _cupy or None
+
+
+def _apply_grid_gpu(gradient, src_xs, src_ys):
+    """Resample gradient at the grid on the GPU with CuPy's bilinear map_coordinates."""
+    cp, cupy_ndimage = _get_cupy()
+    planes = cp.ascontiguousarray(cp.moveaxis(cp.asarray(gradient.reshape(gradient.shape[:2] + (-1,))), -1, 0),
+                                  dtype=cp.float32)
+    coords = cp.stack([cp.asarray(src_ys), cp.asarray(src_xs)])
+    out = cp.empty((planes.shape[0],) + src_xs.shape, dtype=cp.float32)
+    for plane, dst in zip(planes, out):
+        cupy_ndimage.map_coordinates(plane, coords, output=dst, order=1, mode='nearest')
+    result = cp.rint(cp.clip(out, 0, 255)).astype(cp.uint8)
+    return np.ascontiguousarray(cp.asnumpy(cp.moveaxis(result, 0, -1))).reshape(src_xs.shape + gradient.shape[2:])
+
+
+def _is_row_ramp(gradient):
+    """True when every row of gradient is identical, so sampling it only depends on x."""
+    if gradient.shape[0] <= 1:
+        return True
+    # Compare a few rows first so ordinary 2-D gradients bail out without a full pass
+    mid = gradient.shape[0] // 2
+    if not (np.array_equal(gradient[0], gradient[-1]) and np.array_equal(gradient[0], gradient[mid])):
+        return False
+    return bool((gradient == gradient[:1]).all())
+
+
+def apply_grid(gradient, src_xs, src_ys, gpu=False):
+    """
+    Resample gradient at a grid from build_sampling_grid straight into a uint8 image.
+
+    With gpu=True the sampling runs on the GPU through CuPy. Otherwise prefers OpenCV's
+    remap, then the Numba kernel, then a tiled NumPy _bilinear_sample_padded. Numba is
+    only imported when OpenCV is missing, since its import and kernel load cost far more
+    than a cv2.remap call on typical gradient sizes. Every backend rounds samples to the
+    nearest level, as cv2.remap does, so the output does not depend on which is installed.
+    Samples are written straight into the uint8 result without a full-frame float output
+    buffer; the only full-size float array is the NumPy fallback's padded copy of the source.
+    """
+    if gpu:
+        if _get_cupy() is None:
+            raise RuntimeError("GPU sampling requires CuPy")
+        return _apply_grid_gpu(gradient, src_xs, src_ys)
+
+    if cv2 is not None:
+        result = cv2.remap(gradient, np.asarray(src_xs, dtype=np.float32), np.asarray(src_ys, dtype=np.float32),
+                           interpolation=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        if result.dtype != np.uint8:
+            result = np.clip(result, 0, 255).astype(np.uint8)
+        return result.reshape(src_xs.shape + gradient.shape[2:])
+
+    # Row ramps collapse to a 1-D lookup into their first row. cv2.remap is left on the
+    # full image above, since a one-row source sends every sample down its border path.
+    if _is_row_ramp(gradient):
+        gradient = gradient[:1]
+        src_ys = np.zeros(src_xs.shape, dtype=np.float32)
+
+    kernel = _get_numba_kernel()
+    if kernel is not None:
+        img = gradient.reshape(gradient.shape[:2] + (-1,))
+        result = np.empty(src_xs.shape + img.shape[2:], dtype=np.uint8)
+        kernel(img, src_xs, src_ys, result)
+        return result.reshape(src_xs.shape + gradient.shape[2:])
+
+    # NumPy fallback: split channels into contiguous edge-padded float32 planes, filled in
+    # a single allocation, then sample tile by tile so the per-pixel temporaries stay in
+    # cache, clipping each tile into the uint8 result
+    src = gradient.reshape(gradient.shape[:2] + (-1,))
+    src_h, src_w = src.shape[:2]
+    planes = np.empty((src.shape[2], src_h + 1, src_w + 1), dtype=np.float32)
+    planes[:, :src_h, :src_w] = np.moveaxis(src, -1, 0)
+    planes[:, src_h, :src_w] = planes[:, src_h - 1, :src_w]
+    planes[:, :, src_w] = planes[:, :, src_w - 1]
+    grid_h, grid_w = src_xs.shape
+    result = np.empty(src_xs.shape + (planes.shape[0],), dtype=np.uint8)
+    for i0 in range(0, grid_h, SAMPLE_TILE):
+        for j0 in range(0, grid_w, SAMPLE_TILE):
+            tile = (slice(i0, i0 + SAMPLE_TILE), slice(j0, j0 + SAMPLE_TILE))
+            sampled = _bilinear_sample_padded(planes, src_xs[tile], src_ys[tile])
+            np.clip(sampled, 0, 255, out=sampled)
+            np.rint(sampled, out=sampled)
+            result[tile] = np.moveaxis(sampled, 0, -1)
+    return result.reshape(src_xs.shape + gradient.shape[2:])
+
+
+def build_red_to_green_map(erosion, min_samples=1):
     """
     Build a lookup table mapping each red value (0-255) to its most likely green value.
 
     Args:
         erosion: Erosion texture where R = inverted attack, G = release
+        min_samples: Red values seen on fewer pixels than this are interpolated from their neighbours
 
     Returns:
         Array of shape (256,) where index is red value and value is most likely green
     """
-    red_channel = erosion[:, :, 0].flatten()
-    green_channel = erosion[:, :, 1].flatten()
+    if erosion.dtype != np.uint8:
+        raise ValueError(f"Erosion texture must be uint8, got {erosion.dtype}")
 
-    # For each red value, collect all green values and find the mean
-    red_to_green = np.zeros(256, dtype=np.float64)
+    # Joint (R, G) histogram from a single integer pass over the pixels; an 8-bit erosion
+    # texture holds at most 256 x 256 distinct pairs, so the per-red statistics are then
+    # reduced over that small table instead of over every pixel
+    pairs = (erosion[:, :, 0].astype(np.intp) << 8) | erosion[:, :, 1]
+    pair_counts = np.bincount(pairs.ravel(), minlength=256 * 256).reshape(256, 256)
 
-    for r in range(256):
-        mask = red_channel == r
-        if np.any(mask):
-            # Use mean of all green values that appear with this red
-            red_to_green[r] = np.mean(green_channel[mask])
-        else:
-            # No samples for this red value - will interpolate later
-            red_to_green[r] = np.nan
-
-    # Interpolate missing values
-    valid_mask = ~np.isnan(red_to_green)
-    if np.any(valid_mask) and not np.all(valid_mask):
-        valid_indices = np.where(valid_mask)[0]
-        valid_values = red_to_green[valid_mask]
-        all_indices = np.arange(256)
-        red_to_green = np.interp(all_indices, valid_indices, valid_values)
-    elif not np.any(valid_mask):
+    # Mean green per red value
+    counts = pair_counts.sum(axis=1)
+    sums = pair_counts @ np.arange(256)
+
+    valid = counts >= max(min_samples, 1)
+    if not np.any(valid):
         # Fallback: linear mapping if no valid samples
-        red_to_green = np.linspace(0, 255, 256)
+        return np.linspace(0, 255, 256)
 
-    return red_to_green
+    # Interpolate missing red values between the ones with samples
+    valid_indices = np.flatnonzero(valid)
+    return np.interp(np.arange(256), valid_indices, sums[valid] / counts[valid])
 
 
-def remap_gradient(gradient, erosion, fade_in_duration=2.0, fade_out_duration=2.0,
-                   animation_duration=4.0):
+# Most recently used sampling grids, oldest first; each holds two float32 (H x W) arrays,
+# so only a few are kept (a batch run only ever needs the latest one)
+GRID_CACHE_SIZE = 2
+_grid_cache = {}
+
+
+def clear_grid_cache():
+    """Drop every cached sampling grid."""
+    _grid_cache.clear()
+
+
+def build_sampling_grid(erosion, grad_h, grad_w, fade_in_duration=2.0, fade_out_duration=2.0,
+                        animation_duration=4.0):
     """
-    Remap gradient texture from old coordinate system to new using erosion texture.
+    Build the source coordinates that remap a (grad_h x grad_w) gradient using erosion texture.
 
     Builds a red->green lookup from the erosion texture, then for each output pixel
     at (attack, normalized_time), computes the corresponding source coordinate.
+    The grid only depends on the erosion texture, the gradient size and the timing
+    parameters, so it is cached and shared by every gradient remapped with them.
 
     Args:
-        gradient: Input gradient texture (H x W x C)
         erosion: Erosion texture where R = inverted attack, G = release
+        grad_h, grad_w: Size of the gradient texture
         fade_in_duration: Duration of fade-in phase
         fade_out_duration: Duration of fade-out phase
         animation_duration: Total animation duration
+
+    Returns:
+        (src_xs, src_ys) read-only float32 arrays of shape (grad_h, grad_w)
     """
-    grad_h, grad_w = gradient.shape[:2]
-    channels = gradient.shape[2] if gradient.ndim == 3 else 1
+    key = (hashlib.sha1(np.ascontiguousarray(erosion).data).hexdigest(), erosion.shape, erosion.dtype.str,
+           grad_h, grad_w, fade_in_duration, fade_out_duration, animation_duration)
+    if key in _grid_cache:
+        # Move the hit to the most recently used end
+        _grid_cache[key] = _grid_cache.pop(key)
+        return _grid_cache[key]
 
     fade_out_start = animation_duration - fade_out_duration
 
@@ -117,85 +323,182 @@ def remap_gradient(gradient, erosion, fade_in_duration=2.0, fade_out_duration=2.
 
     print(f"Red to green mapping (sample): R=0->{red_to_green[0]:.1f}, R=127->{red_to_green[127]:.1f}, R=255->{red_to_green[255]:.1f}")
 
-    # Create output
-    if gradient.ndim == 3:
-        result = np.zeros((grad_h, grad_w, channels), dtype=np.float64)
+    # Output columns are attack values: attack = col / (grad_w - 1),
+    # which means red = 255 * (1 - attack) = 255 - col * 255 / (grad_w - 1)
+    # The red index is rounded (half up) with integer arithmetic, which always lands in 0-255
+    cols = np.arange(grad_w)
+    if grad_w > 1:
+        attack = cols / (grad_w - 1)
+        red_idx = (((grad_w - 1 - cols) * 255 + (grad_w - 1) // 2) // (grad_w - 1)).astype(np.uint8)
     else:
-        result = np.zeros((grad_h, grad_w), dtype=np.float64)
+        attack = np.full(grad_w, 0.5)
+        red_idx = np.full(grad_w, 128, dtype=np.uint8)
 
-    # For each output column (attack value, which is 1 - red/255)
-    for col in range(grad_w):
-        # Output column corresponds to attack = col / (grad_w - 1)
-        # Which means red = 255 * (1 - attack) = 255 - col * 255 / (grad_w - 1)
-        attack = col / (grad_w - 1) if grad_w > 1 else 0.5
-        red_value = int(round(255 * (1 - attack)))
-        red_value = np.clip(red_value, 0, 255)
+    # Gather the most likely green for every column at once from the 256-entry table
+    release_per_col = red_to_green[red_idx] * (1 / 255.0)
 
-        # Look up the most likely green for this red
-        green_value = red_to_green[red_value]
-        release = green_value / 255.0
+    # Compute timing per column, keeping release strictly after press
+    key_press = fade_in_duration * attack
+    key_release = np.maximum(fade_out_start + release_per_col * fade_out_duration, key_press + 0.001)
 
-        # Compute timing
-        key_press = fade_in_duration * attack
-        key_release = fade_out_start + release * fade_out_duration
+    # Rows are normalized_time from 0 to 1
+    normalized_times = np.linspace(0, 1, grad_h)
 
-        # Handle edge case where release is at or before press
-        if key_release <= key_press + 0.001:
-            key_release = key_press + 0.001
+    # Compute source X coordinates (global_time / animation_duration) for every pixel
+    # global_time = key_press + normalized_time * (key_release - key_press)
+    global_times = key_press[np.newaxis, :] + normalized_times[:, np.newaxis] * (key_release - key_press)[np.newaxis, :]
+    src_xs = (np.clip(global_times / animation_duration, 0, 1) * (grad_w - 1)).astype(np.float32)
 
-        # For each row (normalized_time from 0 to 1)
-        normalized_times = np.linspace(0, 1, grad_h)
+    # Source Y is same as dest Y (normalized_time)
+    src_ys = np.repeat((normalized_times * (grad_h - 1)).astype(np.float32)[:, np.newaxis], grad_w, axis=1)
 
-        # Compute source X coordinates (global_time / animation_duration)
-        # global_time = key_press + normalized_time * (key_release - key_press)
-        global_times = key_press + normalized_times * (key_release - key_press)
-        src_xs = np.clip(global_times / animation_duration, 0, 1) * (grad_w - 1)
+    src_xs.setflags(write=False)
+    src_ys.setflags(write=False)
+    while len(_grid_cache) >= GRID_CACHE_SIZE:
+        del _grid_cache[next(iter(_grid_cache))]
+    _grid_cache[key] = (src_xs, src_ys)
+    return src_xs, src_ys
 
-        # Source Y is same as dest Y (normalized_time)
-        src_ys = normalized_times * (grad_h - 1)
 
-        # Sample the gradient
-        sampled = bilinear_sample(gradient.astype(np.float64), src_xs, src_ys)
-        result[:, col] = sampled
+def remap_gradient(gradient, erosion, fade_in_duration=2.0, fade_out_duration=2.0,
+                   animation_duration=4.0, gpu=False):
+    """
+    Remap gradient texture from old coordinate system to new using erosion texture.
+
+    Args:
+        gradient: Input gradient texture (H x W x C)
+        erosion: Erosion texture where R = inverted attack, G = release
+        fade_in_duration: Duration of fade-in phase
+        fade_out_duration: Duration of fade-out phase
+        animation_duration: Total animation duration
+        gpu: Sample the gradient on the GPU with CuPy
+    """
+    grad_h, grad_w = gradient.shape[:2]
+    src_xs, src_ys = build_sampling_grid(erosion, grad_h, grad_w, fade_in_duration,
+                                         fade_out_duration, animation_duration)
+    return apply_grid(gradient, src_xs, src_ys, gpu=gpu)
 
-    return np.clip(result, 0, 255).astype(np.uint8)
 
 
 
+def load_image(path):
+    """
+    Load an image as an RGB(A) or grayscale uint8 array, decoding with OpenCV when available.
+
+    Both decoders give the same layout: palette images expand to RGB, or RGBA when they
+    carry transparency, grayscale+alpha becomes RGBA (OpenCV cannot return two channels),
+    and bilevel images become 8-bit grayscale. 16-bit images keep their high byte, as PIL
+    does for 16-bit RGB(A) PNGs; any other sample type is rejected.
+    """
+    if cv2 is not None:
+        img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+        if img is None:
+            raise OSError(f"Could not read image: {path}")
+        if img.ndim == 3 and img.shape[2] == 3:
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        elif img.ndim == 3 and img.shape[2] == 4:
+            img = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
+    elif Image is not None:
+        pil_img = Image.open(path)
+        if pil_img.mode in ('LA', 'PA'):
+            pil_img = pil_img.convert('RGBA')
+        elif pil_img.mode == 'P':
+            pil_img = pil_img.convert('RGBA' if 'transparency' in pil_img.info else 'RGB')
+        elif pil_img.mode == '1':
+            pil_img = pil_img.convert('L')
+        elif pil_img.mode not in ('L', 'RGB', 'RGBA', 'I', 'F') and not pil_img.mode.startswith('I;16'):
+            # CMYK, YCbCr and other colour spaces are decoded to RGB by OpenCV
+            pil_img = pil_img.convert('RGB')
+        img = np.array(pil_img)
+    else:
+        raise ImportError("Reading images requires OpenCV (cv2) or Pillow")
+
+    if img.dtype == np.uint16:
+        img = (img >> 8).astype(np.uint8)
+    elif img.dtype != np.uint8:
+        raise ValueError(f"Unsupported {img.dtype} image, expected 8 or 16 bits per channel: {path}")
+    return img
+
+
+def save_image(path, img, png_compression=1):
+    """
+    Save an RGB(A) or grayscale uint8 array, encoding with OpenCV when available.
+
+    png_compression is the zlib level (0-9) for PNG output; the default of 1 is several
+    times faster to encode than the usual 6 for a slightly larger file.
+    """
+    if cv2 is None:
+        if Image is None:
+            raise ImportError("Writing images requires OpenCV (cv2) or Pillow")
+        Image.fromarray(img).save(path, compress_level=png_compression)
+        return
+
+    if img.ndim == 3 and img.shape[2] == 3:
+        img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+    elif img.ndim == 3 and img.shape[2] == 4:
+        img = cv2.cvtColor(img, cv2.COLOR_RGBA2BGRA)
+    if not cv2.imwrite(path, img, [cv2.IMWRITE_PNG_COMPRESSION, png_compression]):
+        raise OSError(f"Could not write image: {path}")
+
 
 def main():
     parser = argparse.ArgumentParser(
         description='Remap gradient texture to new UV coordinate system using erosion texture'
     )
     parser.add_argument('erosion', type=str, nargs='?', default="/home/anyuser/websites/spehleonlp.github.io/erosion/fxMapInOut-boost.png", help='Path to erosion texture (R=inverted attack, G=release)')
-    parser.add_argument('gradient', type=str, nargs='?', default="/home/anyuser/websites/spehleonlp.github.io/erosion/boom_ramp2D.png", help='Path to input gradient texture')
-    parser.add_argument('output', type=str, nargs='?', default="/home/anyuser/websites/spehleonlp.github.io/erosion/boom_ramp2D_remapped.png", help='Path for output remapped gradient')
+    # gradient and output default to None so an explicit value can be told apart from --batch
+    default_gradient = "/home/anyuser/websites/spehleonlp.github.io/erosion/boom_ramp2D.png"
+    default_output = "/home/anyuser/websites/spehleonlp.github.io/erosion/boom_ramp2D_remapped.png"
+    parser.add_argument('gradient', type=str, nargs='?', help='Path to input gradient texture')
+    parser.add_argument('output', type=str, nargs='?', help='Path for output remapped gradient')
     parser.add_argument('--fade-in', type=float, default=0.5, help='Fade in duration (default: 0.5)')
     parser.add_argument('--fade-out', type=float, default=2.0, help='Fade out duration (default: 2.0)')
     parser.add_argument('--duration', type=float, default=2.0, help='Animation duration (default: 2.0)')
+    parser.add_argument('--batch', type=str, nargs='+', metavar='GRADIENT',
+                        help='Remap several gradients in one run, writing each as a PNG to <name>_remapped.png '
+                             'next to it (replaces the gradient and output arguments)')
+    parser.add_argument('--gpu', action='store_true', help='Sample the gradient on the GPU (requires CuPy)')
+    parser.add_argument('--png-compression', type=int, default=1, choices=range(10), metavar='0-9',
+                        help='zlib level for PNG output, higher is smaller but slower (default: 1)')
 
     args = parser.parse_args()
 
+    if args.gpu and _get_cupy() is None:
+        parser.error('--gpu requires CuPy')
+
+    if args.batch:
+        if args.gradient is not None or args.output is not None:
+            parser.error('--batch cannot be combined with the gradient and output arguments')
+        jobs = [(path, os.path.splitext(path)[0] + '_remapped.png') for path in args.batch]
+        if len({output_path for _, output_path in jobs}) < len(jobs):
+            parser.error('--batch inputs must not share a name, their outputs would overwrite each other')
+    else:
+        jobs = [(args.gradient or default_gradient, args.output or default_output)]
+
     # Load images
-    erosion = np.array(Image.open(args.erosion))
-    gradient = np.array(Image.open(args.gradient))
+    erosion = load_image(args.erosion)
 
     print(f"Erosion texture: {erosion.shape}")
-    print(f"Gradient texture: {gradient.shape}")
     print(f"Parameters: fade_in={args.fade_in}, fade_out={args.fade_out}, duration={args.duration}")
 
-    # Remap
-    remapped = remap_gradient(
-        gradient,
-        erosion,
-        fade_in_duration=args.fade_in,
-        fade_out_duration=args.fade_out,
-        animation_duration=args.duration
-    )
-
-    # Save
-    Image.fromarray(remapped).save(args.output)
-    print(f"Saved remapped gradient to: {args.output}")
+    # The sampling grid and compiled kernels are shared by every gradient in the run
+    for gradient_path, output_path in jobs:
+        gradient = load_image(gradient_path)
+        print(f"Gradient texture: {gradient.shape}")
+
+        # Remap
+        remapped = remap_gradient(
+            gradient,
+            erosion,
+            fade_in_duration=args.fade_in,
+            fade_out_duration=args.fade_out,
+            animation_duration=args.duration,
+            gpu=args.gpu
+        )
+
+        # Save
+        save_image(output_path, remapped, png_compression=args.png_compression)
+        print(f"Saved remapped gradient to: {output_path}")
 
 
 if __name__ == '__main__':
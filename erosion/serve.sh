@@ -9,11 +9,13 @@ echo "Starting local server on http://localhost:$PORT"
 echo "Press Ctrl+C to stop"
 echo ""
 
+SERVER="$(dirname "$0")/server.py"
+
 # Try python3 first, then python, then node
 if command -v python3 &> /dev/null; then
-    python3 -m http.server $PORT
+    python3 "$SERVER" $PORT
 elif command -v python &> /dev/null; then
-    python -m http.server $PORT
+    python "$SERVER" $PORT
 elif command -v node &> /dev/null; then
     npx http-server -p $PORT
 else
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Local development server for the erosion app.
+
+Serves the current directory like `python3 -m http.server`, but speaks HTTP/1.1 so the
+browser can keep connections alive while it pulls in the WASM and script assets, handles
+requests on separate threads, and sends the cross-origin isolation headers directly
+(coi-serviceworker.js remains the fallback for static hosting).
+
+Usage: python3 server.py [port]
+"""
+
+import sys
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+
+class CustomHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def end_headers(self):
+        self.send_header("Cross-Origin-Opener-Policy", "same-origin")
+        self.send_header("Cross-Origin-Embedder-Policy", "require-corp")
+        super().end_headers()
+
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), CustomHandler)
+    print(f"Serving on http://localhost:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()